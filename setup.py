@@ -46,6 +46,13 @@ ext_modules = [
         libraries=libraries,
         extra_compile_args=extra_compile_args,
     ),
+    # The public API is plain Python but we compile it to avoid the
+    # interpreter overhead of the thin wrappers around `ucp._libs.core`
+    Extension(
+        "ucp.public_api",
+        sources=["ucp/public_api.py"],
+        extra_compile_args=extra_compile_args,
+    ),
 ]
 
 setup(
@@ -31,7 +31,7 @@ async def test_reset():
 
 
 @pytest.mark.asyncio
-async def test_lt_still_in_scope_error():
+async def test_lt_still_in_scope():
     reset = ResetAfterN(2)
 
     def server(ep):
@@ -41,15 +41,12 @@ async def test_lt_still_in_scope_error():
     lt = ucp.create_listener(server)
     ep = await ucp.create_endpoint(ucp.get_address(), lt.port)
     del ep
-    with pytest.raises(ucp.exceptions.UCXError, match="ucp._libs.core._Listener"):
-        ucp.reset()
-
-    lt.close()
     ucp.reset()
+    assert lt.closed()
 
 
 @pytest.mark.asyncio
-async def test_ep_still_in_scope_error():
+async def test_ep_still_in_scope():
     reset = ResetAfterN(2)
 
     def server(ep):
@@ -59,7 +56,13 @@ async def test_ep_still_in_scope_error():
     lt = ucp.create_listener(server)
     ep = await ucp.create_endpoint(ucp.get_address(), lt.port)
     del lt
-    with pytest.raises(ucp.exceptions.UCXError, match="_ucp_endpoint"):
-        ucp.reset()
-    ep.close()
     ucp.reset()
+    assert ep.closed()
+
+
+def test_ctx_still_in_scope_error():
+    ucp.reset()
+    ctx = ucp.public_api._get_ctx()
+    with pytest.raises(ucp.exceptions.UCXError, match="ApplicationContext"):
+        ucp.reset()
+    del ctx
@@ -132,3 +132,280 @@ async def test_send_recv_error():
         ucp.exceptions.UCXError, match=r"length mismatch: 3 \(got\) != 100 \(expected\)"
     ):
         await client.recv(msg)
+
+
+@pytest.mark.asyncio
+async def test_send_recv_multi():
+    sizes = [1, 10, 1000]
+
+    async def echo_server(ep):
+        msgs = [np.empty(n, dtype=np.int64) for n in sizes]
+        await ep.recv_multi(msgs)
+        await ep.send_multi(msgs)
+
+    listener = ucp.create_listener(echo_server)
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    msgs = [np.arange(n, dtype=np.int64) for n in sizes]
+    await client.send_multi(msgs)
+    resps = [np.empty_like(msg) for msg in msgs]
+    await client.recv_multi(resps)
+    for resp, msg in zip(resps, msgs):
+        np.testing.assert_array_equal(resp, msg)
+
+
+@pytest.mark.asyncio
+async def test_recv_multi_short_frame():
+    sizes = [10, 5, 10]
+
+    async def server(ep):
+        await ep.send_multi([np.arange(n, dtype=np.int64) for n in sizes])
+        await ep.send(np.array([42], dtype=np.int64))
+
+    listener = ucp.create_listener(server)
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    resps = [np.empty(10, dtype=np.int64) for _ in sizes]
+    with pytest.raises(ucp.exceptions.UCXError, match="length mismatch"):
+        await client.recv_multi(resps)
+    # Every receive has finished before the error is raised
+    np.testing.assert_array_equal(resps[0], np.arange(10, dtype=np.int64))
+    np.testing.assert_array_equal(resps[2], np.arange(10, dtype=np.int64))
+    # and none of them consumed the peer's next message
+    resp = np.empty(1, dtype=np.int64)
+    await client.recv(resp)
+    assert resp[0] == 42
+
+
+@pytest.mark.asyncio
+async def test_send_recv_registered_memory():
+    msg = np.arange(100, dtype=np.int64)
+    msg_size = np.array([msg.nbytes], dtype=np.uint64)
+
+    listener = ucp.create_listener(make_echo_server(lambda n: bytearray(n)))
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    msg_handle = ucp.register_memory(msg)
+    await client.send(msg_size)
+    await client.send(msg_handle)
+    resp = np.empty_like(msg)
+    resp_handle = ucp.register_memory(resp)
+    await client.recv(resp_handle)
+    np.testing.assert_array_equal(resp, msg)
+    msg_handle.close()
+    resp_handle.close()
+    assert resp_handle.closed()
+
+
+def test_register_memory_pins_buffer():
+    buf = bytearray(100)
+    handle = ucp.register_memory(buf)
+    with pytest.raises(BufferError):
+        buf.extend(b"m")
+    with pytest.raises(BufferError):
+        del buf[:10]
+    handle.close()
+    buf.extend(b"m")
+
+
+@pytest.mark.asyncio
+async def test_recv_buffered():
+    msgs = [bytearray(b"m" * 100), bytearray(b"n" * 10)]
+
+    async def server(ep):
+        for msg in msgs:
+            await ep.send(msg)
+
+    listener = ucp.create_listener(server)
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    buf = client.get_recv_buffer(100)
+    assert buf.nbytes >= 100
+    for msg in msgs:
+        await client.recv_buffered(len(msg))
+        assert buf[: len(msg)] == msg
+    assert client.get_recv_buffer(10) is buf
+
+
+@pytest.mark.asyncio
+async def test_get_recv_buffer_during_recv_buffered():
+    msg = bytearray(b"m" * 10)
+
+    async def server(ep):
+        await ep.recv(bytearray(1))
+        await ep.send(msg)
+
+    listener = ucp.create_listener(server)
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    buf = client.get_recv_buffer(10)
+    task = asyncio.ensure_future(client.recv_buffered(len(msg)))
+    await asyncio.sleep(0)
+    with pytest.raises(ucp.exceptions.UCXError, match="recv_buffered"):
+        client.get_recv_buffer(100)
+    assert client.get_recv_buffer(10) is buf
+    await client.send(bytearray(1))
+    await task
+    assert buf[: len(msg)] == msg
+    assert client.get_recv_buffer(100).nbytes >= 100
+
+
+@pytest.mark.asyncio
+async def test_send_cache():
+    from ucp._libs.core import BUFFER_CACHE_MAX_NBYTES, BUFFER_CACHE_SIZE
+
+    small = [bytes([i]) * 10 for i in range(BUFFER_CACHE_SIZE + 1)]
+    large = bytes(BUFFER_CACHE_MAX_NBYTES + 1)
+    mutable = bytearray(10)
+    msgs = small + [small[-1], large, mutable]
+
+    async def server(ep):
+        for msg in msgs:
+            resp = bytearray(len(msg))
+            await ep.recv(resp)
+            assert resp == msg
+
+    listener = ucp.create_listener(server)
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    cache = client._ep._send_cache
+    for msg in small:
+        await client.send(msg)
+    # The least recently used object is evicted
+    assert len(cache) == BUFFER_CACHE_SIZE
+    assert id(small[0]) not in cache
+    # A hit reuses the cached info and makes it the most recently used
+    info = cache[id(small[-1])]
+    await client.send(small[-1])
+    assert cache[id(small[-1])] is info
+    assert list(cache)[-1] == id(small[-1])
+    # Large and mutable buffers are never cached
+    await client.send(large)
+    await client.send(mutable)
+    assert id(large) not in cache
+    assert id(mutable) not in cache
+    assert len(cache) == BUFFER_CACHE_SIZE
+
+
+@pytest.mark.asyncio
+async def test_recv_checks_buffer_every_time():
+    async def server(ep):
+        for _ in range(3):
+            await ep.send(np.arange(10, dtype=np.int64))
+
+    listener = ucp.create_listener(server)
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    resp = np.empty(10, dtype=np.int64)
+    handle = ucp.register_memory(resp)
+    await client.recv(handle)
+    handle.close()
+    with pytest.raises(ucp.exceptions.UCXCloseError):
+        await client.recv(handle)
+    await client.recv(resp)
+    resp.flags.writeable = False
+    with pytest.raises(ValueError, match="readonly"):
+        await client.recv(resp)
+    resp.flags.writeable = True
+    await client.recv(resp)
+    np.testing.assert_array_equal(resp, np.arange(10, dtype=np.int64))
+
+
+@pytest.mark.asyncio
+async def test_send_recv_sync():
+    async def echo_server(ep):
+        msg = np.empty(10, dtype=np.int64)
+        await ep.recv(msg)
+        await ep.send(msg)
+
+    listener = ucp.create_listener(echo_server)
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    msg = np.arange(10, dtype=np.int64)
+    fut = client.send_sync(msg)
+    if fut is not None:
+        await fut
+    resp = np.empty_like(msg)
+    fut = client.recv_sync(resp)
+    if fut is not None:
+        await fut
+    np.testing.assert_array_equal(resp, msg)
+
+
+@pytest.mark.asyncio
+async def test_recv_sync_of_arrived_message():
+    async def server(ep):
+        await ep.send(np.arange(10, dtype=np.int64))
+        await ep.send(np.arange(10, 20, dtype=np.int64))
+
+    listener = ucp.create_listener(server)
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    resp = np.empty(10, dtype=np.int64)
+    await client.recv(resp)
+    # Give the second message time to arrive and be progressed into
+    # the unexpected queue, thus the receive completes immediately
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+        ucp.progress()
+    assert client.recv_sync(resp) is None
+    np.testing.assert_array_equal(resp, np.arange(10, 20, dtype=np.int64))
+
+
+@pytest.mark.asyncio
+async def test_try_progress():
+    msg = np.arange(10 ** 6, dtype=np.int64)
+    resp = np.empty_like(msg)
+
+    async def server(ep):
+        # Post the receive before telling the client to send
+        fut = ep.recv_sync(resp)
+        await ep.send(bytearray(1))
+        if fut is not None:
+            await fut
+
+    listener = ucp.create_listener(server)
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    await client.recv(bytearray(1))
+    fut = client.send_sync(msg)
+    assert fut is not None
+    # Drive the transfer without yielding to the event loop
+    events = 0
+    for _ in range(10 ** 6):
+        n = ucp.try_progress()
+        events += n
+        if n == 0 and fut.done():
+            break
+    assert events > 0
+    assert fut.done()
+    await fut
+    np.testing.assert_array_equal(resp, msg)
+
+
+@pytest.mark.asyncio
+async def test_send_recv_full_and_n():
+    async def echo_server(ep):
+        msg = np.empty(10, dtype=np.int64)
+        await ep.recv_full(msg)
+        await ep.send_n(msg, msg.nbytes)
+
+    listener = ucp.create_listener(echo_server)
+    client = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    msg = np.arange(10, dtype=np.int64)
+    await client.send_full(msg)
+    resp = np.empty_like(msg)
+    await client.recv_n(resp, resp.nbytes)
+    np.testing.assert_array_equal(resp, msg)
+
+
+@pytest.mark.asyncio
+async def test_progress_until_idle():
+    max_iters = 4
+    msg = np.arange(10 ** 6, dtype=np.int64)
+
+    async def server(ep):
+        resp = np.empty_like(msg)
+        await ep.recv(resp)
+        np.testing.assert_array_equal(resp, msg)
+
+    listener = ucp.create_listener(server)
+    ep = await ucp.create_endpoint(ucp.get_address(), listener.port)
+    fut = ep.send_sync(msg)
+    for _ in range(1000):
+        n = ucp.progress_until_idle(max_iters=max_iters)
+        if n > 0:
+            break
+    assert 0 < n <= max_iters
+    if fut is not None:
+        await fut
@@ -88,3 +88,18 @@ async def test_listener_del():
     assert listener.closed() is False
     del listener
     await ep.recv(msg)
+
+
+@pytest.mark.asyncio
+async def test_endpoint_context_manager():
+    """The client closes the endpoint using `async with`"""
+
+    async def server_node(ep):
+        await ep.send(np.arange(100, dtype=np.int64))
+
+    listener = ucp.create_listener(server_node)
+    async with await ucp.create_endpoint(ucp.get_address(), listener.port) as ep:
+        msg = np.empty(100, dtype=np.int64)
+        await ep.recv(msg)
+        assert ep.closed() is False
+    assert ep.closed() is True
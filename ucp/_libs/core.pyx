@@ -18,8 +18,27 @@ from ..exceptions import (
     UCXConfigError,
 )
 
-from .send_recv import tag_send, tag_recv, stream_send, stream_recv
-from .utils import get_buffer_nbytes
+from .send_recv import (
+    tag_send,
+    tag_recv,
+    tag_send_data,
+    tag_recv_data,
+    stream_send,
+    stream_recv,
+)
+from .utils import (
+    get_buffer_data,
+    get_buffer_data_and_readonly,
+    get_buffer_nbytes,
+)
+
+
+# The number of `bytes` objects in the send cache of each _Endpoint (see
+# `_Endpoint._get_buffer_info()`) and the maximum size of a cached object.
+# The cache keeps its objects alive thus only small objects are cached,
+# which is also where the buffer lookups make up most of a transfer.
+BUFFER_CACHE_SIZE = 4
+BUFFER_CACHE_MAX_NBYTES = 2 ** 16
 
 
 cdef assert_ucs_status(ucs_status_t status, msg_context=None):
@@ -198,6 +217,7 @@ async def listener_handler(ucp_endpoint, ctx, ucp_worker, func):
 
     # Create the public Endpoint
     pub_ep = Endpoint(ep)
+    ctx._live.add(pub_ep)
 
     # Setup the control receive
     setup_ctrl_recv(ep, pub_ep)
@@ -252,6 +272,62 @@ cdef class _Listener:
         self._ctx = None
 
 
+cdef class MemoryHandle:
+    """A handle to a buffer registered with UCX
+
+    The handle exposes the array/cuda interface of the registered buffer
+    thus it can be given directly to `Endpoint.send()` and `Endpoint.recv()`.
+    Please use `register_memory()` to create a MemoryHandle.
+    """
+    cdef:
+        ucp_mem_h _memh
+        ucp_context_h _context
+        object _ctx
+        object _buffer
+        object __weakref__
+        bint _cuda
+        bint _readonly
+
+    cdef readonly:
+        object address
+        size_t nbytes
+
+    def __dealloc__(self):
+        self.close()
+
+    def closed(self):
+        return self._ctx is None
+
+    def close(self):
+        if self._ctx is not None:
+            assert_ucs_status(ucp_mem_unmap(self._context, self._memh))
+            self._ctx = None
+            self._buffer = None
+
+    @property
+    def __array_interface__(self):
+        if self._cuda:
+            raise AttributeError("__array_interface__")
+        return self._get_interface()
+
+    @property
+    def __cuda_array_interface__(self):
+        if not self._cuda:
+            raise AttributeError("__cuda_array_interface__")
+        return self._get_interface()
+
+    def _get_interface(self):
+        if self._ctx is None:
+            raise UCXCloseError("MemoryHandle closed")
+        return {
+            "data": (self.address, self._readonly),
+            "shape": (self.nbytes,),
+            "strides": None,
+            "typestr": "|u1",
+            "version": 0 if self._cuda else 3,
+        }
+
+
 cdef class ApplicationContext:
     cdef:
         object __weakref__
@@ -262,6 +338,13 @@ cdef class ApplicationContext:
         object all_epoll_binded_to_event_loop
         bint initiated
 
+    cdef readonly:
+        # Weak references to all Listeners, Endpoints, and MemoryHandles
+        # created using this context
+        object _live
+        # A finalizer that is alive for as long as this context is
+        object _finalizer
+
     cdef public:
         object config
 
@@ -270,6 +353,11 @@ cdef class ApplicationContext:
         cdef ucp_worker_params_t worker_params
         cdef ucs_status_t status
         self.all_epoll_binded_to_event_loop = set()
+        self._live = weakref.WeakSet()
+        self._finalizer = weakref.finalize(
+            self, logging.debug, "ApplicationContext deallocated"
+        )
+        self._finalizer.atexit = False
         self.config = {}
         self.initiated = False
 
@@ -359,7 +447,9 @@ cdef class ApplicationContext:
         )
         c_util_get_ucp_listener_params_free(&params)
         assert_ucs_status(status)
-        return Listener(ret)
+        pub_lt = Listener(ret)
+        self._live.add(pub_lt)
+        return pub_lt
 
     async def create_endpoint(self, str ip_address, port):
         from ..public_api import Endpoint
@@ -408,6 +498,7 @@ cdef class ApplicationContext:
 
         # Create the public Endpoint
         pub_ep = Endpoint(ep)
+        self._live.add(pub_ep)
 
         # Setup the control receive
         setup_ctrl_recv(ep, pub_ep)
@@ -419,6 +510,15 @@ cdef class ApplicationContext:
         while ucp_worker_progress(self.worker) != 0:
             pass
 
+    def try_progress(self):
+        return ucp_worker_progress(self.worker)
+
+    cpdef int progress_until_idle(self, int max_iters=64):
+        cdef int count = 0
+        while count < max_iters and ucp_worker_progress(self.worker) != 0:
+            count += 1
+        return count
+
     def _fd_reader_callback(self):
         cdef ucs_status_t status
         self.progress()
@@ -436,6 +536,36 @@ cdef class ApplicationContext:
             loop.add_reader(self.epoll_fd, self._fd_reader_callback)
             self.all_epoll_binded_to_event_loop.add(loop)
 
+    def register_memory(self, buffer):
+        if not (hasattr(buffer, "__cuda_array_interface__") or
+                hasattr(buffer, "__array_interface__")):
+            # Holding a buffer export prevents the memory from being freed
+            # while registered e.g. by resizing a bytearray
+            buffer = memoryview(buffer)
+        cuda_support = "cuda" in self.config['TLS'] or self.config['TLS'] == "all"
+        nbytes = get_buffer_nbytes(buffer, check_min_size=None,
+                                   cuda_support=cuda_support)
+        address, readonly = get_buffer_data_and_readonly(buffer)
+
+        cdef ucp_mem_map_params_t params
+        params.field_mask = (UCP_MEM_MAP_PARAM_FIELD_ADDRESS |  # noqa
+                             UCP_MEM_MAP_PARAM_FIELD_LENGTH)
+        params.address = PyLong_AsVoidPtr(address)
+        params.length = nbytes
+
+        ret = MemoryHandle()
+        cdef ucs_status_t status = ucp_mem_map(self.context, &params, &ret._memh)
+        assert_ucs_status(status, "register_memory()")
+        ret._context = self.context
+        ret._ctx = self
+        ret._buffer = buffer
+        ret._cuda = hasattr(buffer, "__cuda_array_interface__")
+        ret._readonly = readonly
+        ret.address = address
+        ret.nbytes = nbytes
+        self._live.add(ret)
+        return ret
+
     def get_ucp_worker(self):
         return PyLong_FromVoidPtr(<void*>self.worker)
 
@@ -447,6 +577,19 @@ cdef class ApplicationContext:
             loop.remove_reader(self.epoll_fd)
 
 
+async def _gather_all(futures):
+    """Await all of `futures` and then raise the first exception, if any
+
+    Unlike a plain `asyncio.gather()`, no operation is left posted when one
+    of them fails thus the caller's buffers aren't written to after the
+    exception is raised and the following messages of the peer aren't
+    consumed by leftover receives.
+    """
+    for ret in await asyncio.gather(*futures, return_exceptions=True):
+        if isinstance(ret, BaseException):
+            raise ret
+
+
 class _Endpoint:
     """This represents the private part of Endpoint
 
@@ -474,6 +617,13 @@ class _Endpoint:
         self._recv_count = 0
         self._closed = False
         self.pending_msg_list = []
+        # Maps id(buffer) to (buffer, data, nbytes) of recently sent small
+        # `bytes` objects ordered from least to most recently used
+        self._send_cache = {}
+        # The registered staging buffer used by `recv_buffered()`
+        self._recv_mv = None
+        self._recv_handle = None
+        self._recv_buffered_pending = 0
         # UCX supports CUDA if "cuda" is part of the TLS or TLS is "all"
         self._cuda_support = "cuda" in ctx.config['TLS'] or ctx.config['TLS'] == "all"
 
@@ -531,50 +681,193 @@ class _Endpoint:
                     pass
             assert not UCS_PTR_IS_ERR(status)
             ucp_request_free(status)
+        if self._recv_handle is not None:
+            self._recv_handle.close()
+            self._recv_handle = None
+        self._send_cache.clear()
         self._ctx = None
 
     def __del__(self):
         if not self._closed:
             self.close()
 
-    async def send(self, buffer, nbytes=None):
-        if self._closed:
-            raise UCXCloseError("send() - _Endpoint closed")
-        nbytes = get_buffer_nbytes(buffer, check_min_size=nbytes,
-                                   cuda_support=self._cuda_support)
+    def _tag_send(self, data, nbytes, none_if_done=False):
+        """Issue the send of `nbytes` from the data pointer `data`
+
+        Returns the future of the send or None if `none_if_done=True` and
+        the send completed immediately. Notice, the caller must keep
+        the buffer of `data` alive until the future is done.
+        """
         log = "[Send #%03d] ep: %s, tag: %s, nbytes: %d" % (
             self._send_count, hex(self.uid), hex(self._msg_tag_send), nbytes
         )
         logging.debug(log)
         self.pending_msg_list.append({'log': log})
         self._send_count += 1
-        return await tag_send(
+        return tag_send_data(
             self._ucp_endpoint,
-            buffer,
+            data,
             nbytes,
             self._msg_tag_send,
-            pending_msg=self.pending_msg_list[-1]
+            pending_msg=self.pending_msg_list[-1],
+            none_if_done=none_if_done
         )
 
-    async def recv(self, buffer, nbytes=None):
-        if self._closed:
-            raise UCXCloseError("recv() - _Endpoint closed")
-        nbytes = get_buffer_nbytes(buffer, check_min_size=nbytes,
-                                   cuda_support=self._cuda_support)
+    def _tag_recv(self, data, nbytes, none_if_done=False):
+        """Issue the receive of `nbytes` into the data pointer `data`
+
+        Returns the future of the receive or None if `none_if_done=True` and
+        the receive completed immediately. Notice, the caller must keep
+        the buffer of `data` alive until the future is done.
+        """
         log = "[Recv #%03d] ep: %s, tag: %s, nbytes: %d" % (
             self._recv_count, hex(self.uid), hex(self._msg_tag_recv), nbytes
         )
         logging.debug(log)
         self.pending_msg_list.append({'log': log})
         self._recv_count += 1
-        return await tag_recv(
+        return tag_recv_data(
             self._ucp_worker,
-            buffer,
+            data,
             nbytes,
             self._msg_tag_recv,
-            pending_msg=self.pending_msg_list[-1]
+            pending_msg=self.pending_msg_list[-1],
+            none_if_done=none_if_done
         )
 
+    def _get_buffer_info(self, buffer, nbytes, check_writable):
+        """Returns the data pointer and size of `buffer`
+
+        Raise ValueError if `buffer` is smaller than `nbytes` or if
+        `check_writable=True` and `buffer` is read-only.
+
+        The info of recently sent small `bytes` objects is cached thus
+        repeated sends of the same object skip the buffer lookups. Only
+        `bytes` are cached because they are immutable thus their info never
+        goes stale; all other buffers, and all receives, are looked up every
+        time. Notice, the cache keeps up to BUFFER_CACHE_SIZE objects of at
+        most BUFFER_CACHE_MAX_NBYTES alive until they are evicted or the
+        endpoint is closed. The references also make the ids unique.
+        """
+        if check_writable or type(buffer) is not bytes:
+            size = get_buffer_nbytes(buffer, check_min_size=nbytes,
+                                     cuda_support=self._cuda_support)
+            return get_buffer_data(buffer, check_writable=check_writable), size
+
+        cache = self._send_cache
+        key = id(buffer)
+        info = cache.pop(key, None)
+        if info is None:
+            size = get_buffer_nbytes(buffer, check_min_size=None,
+                                     cuda_support=self._cuda_support)
+            info = (buffer, get_buffer_data(buffer, check_writable=False), size)
+            if size > BUFFER_CACHE_MAX_NBYTES:
+                cache = None
+        _, data, size = info
+        if nbytes is not None and size < nbytes:
+            raise ValueError("the nbytes is greater than the size of the buffer!")
+        if cache is not None:
+            cache[key] = info
+            if len(cache) > BUFFER_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        return data, size
+
+    def _get_multi_data(self, buffers, nbytes, check_writable):
+        """Returns the data pointer and size of each buffer in `buffers`
+
+        All buffers are checked before anything is sent or received, thus an
+        invalid buffer never leaves the peer with a partial message sequence.
+        """
+        if nbytes is None:
+            nbytes = [None] * len(buffers)
+        elif len(nbytes) != len(buffers):
+            raise ValueError("the length of buffers and nbytes must be equal")
+        return [
+            self._get_buffer_info(buffer, n, check_writable)
+            for buffer, n in zip(buffers, nbytes)
+        ]
+
+    async def send_full(self, buffer):
+        if self._closed:
+            raise UCXCloseError("send_full() - _Endpoint closed")
+        data, nbytes = self._get_buffer_info(buffer, None, False)
+        return await self._tag_send(data, nbytes)
+
+    async def send_n(self, buffer, nbytes):
+        if self._closed:
+            raise UCXCloseError("send_n() - _Endpoint closed")
+        data, nbytes = self._get_buffer_info(buffer, nbytes, False)
+        return await self._tag_send(data, nbytes)
+
+    async def recv_full(self, buffer):
+        if self._closed:
+            raise UCXCloseError("recv_full() - _Endpoint closed")
+        data, nbytes = self._get_buffer_info(buffer, None, True)
+        return await self._tag_recv(data, nbytes)
+
+    async def recv_n(self, buffer, nbytes):
+        if self._closed:
+            raise UCXCloseError("recv_n() - _Endpoint closed")
+        data, nbytes = self._get_buffer_info(buffer, nbytes, True)
+        return await self._tag_recv(data, nbytes)
+
+    def send_sync(self, buffer, nbytes=None):
+        if self._closed:
+            raise UCXCloseError("send_sync() - _Endpoint closed")
+        data, nbytes = self._get_buffer_info(buffer, nbytes, check_writable=False)
+        return self._tag_send(data, nbytes, none_if_done=True)
+
+    def recv_sync(self, buffer, nbytes=None):
+        if self._closed:
+            raise UCXCloseError("recv_sync() - _Endpoint closed")
+        data, nbytes = self._get_buffer_info(buffer, nbytes, check_writable=True)
+        return self._tag_recv(data, nbytes, none_if_done=True)
+
+    async def send_multi(self, buffers, nbytes=None):
+        if self._closed:
+            raise UCXCloseError("send_multi() - _Endpoint closed")
+        msgs = self._get_multi_data(buffers, nbytes, check_writable=False)
+        # The sends use the same tag thus the peer matches them in order
+        await _gather_all([self._tag_send(d, n) for d, n in msgs])
+
+    async def recv_multi(self, buffers, nbytes=None):
+        if self._closed:
+            raise UCXCloseError("recv_multi() - _Endpoint closed")
+        msgs = self._get_multi_data(buffers, nbytes, check_writable=True)
+        # The receives use the same tag thus they are matched in order
+        await _gather_all([self._tag_recv(d, n) for d, n in msgs])
+
+    def get_recv_buffer(self, sizehint):
+        if self._closed:
+            raise UCXCloseError("get_recv_buffer() - _Endpoint closed")
+        if self._recv_mv is None or self._recv_mv.nbytes < sizehint:
+            if self._recv_buffered_pending:
+                raise UCXError(
+                    "get_recv_buffer() - cannot reallocate the receive buffer "
+                    "while recv_buffered() is pending"
+                )
+            if self._recv_handle is not None:
+                self._recv_handle.close()
+            self._recv_mv = memoryview(bytearray(max(sizehint, 1)))
+            self._recv_handle = self._ctx.register_memory(self._recv_mv)
+        return self._recv_mv
+
+    async def recv_buffered(self, nbytes):
+        if self._closed:
+            raise UCXCloseError("recv_buffered() - _Endpoint closed")
+        if self._recv_mv is None or self._recv_mv.nbytes < nbytes:
+            raise ValueError(
+                "the nbytes is greater than the size of the receive buffer, "
+                "please call get_recv_buffer() first"
+            )
+        # Keep the buffer alive until the receive has finished
+        mv, handle = self._recv_mv, self._recv_handle
+        self._recv_buffered_pending += 1
+        try:
+            return await self._tag_recv(handle.address, nbytes)
+        finally:
+            self._recv_buffered_pending -= 1
+
     def ucx_info(self):
         if self._closed:
             raise UCXCloseError("pprint_ep() - _Endpoint closed")
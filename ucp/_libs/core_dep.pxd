@@ -183,6 +183,22 @@ cdef extern from "ucp/api/ucp.h":
     unsigned UCP_EP_CLOSE_MODE_FLUSH
     ucs_status_ptr_t ucp_ep_close_nb(ucp_ep_h ep, unsigned mode)
 
+    ctypedef struct ucp_mem_h:
+        pass
+
+    ctypedef struct ucp_mem_map_params_t:
+        uint64_t field_mask
+        void *address
+        size_t length
+        unsigned flags
+
+    int UCP_MEM_MAP_PARAM_FIELD_ADDRESS
+    int UCP_MEM_MAP_PARAM_FIELD_LENGTH
+    ucs_status_t ucp_mem_map(ucp_context_h context,
+                             const ucp_mem_map_params_t *params,
+                             ucp_mem_h *memh_p)
+    ucs_status_t ucp_mem_unmap(ucp_context_h context, ucp_mem_h memh)
+
     void ucp_request_cancel(ucp_worker_h worker, void *request)
     ucs_status_t ucp_request_check_status(void *request)
 
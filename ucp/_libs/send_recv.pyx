@@ -52,6 +52,25 @@ cdef create_future_from_comm_status(ucs_status_ptr_t status,
     return ret
 
 
+cdef create_future_or_none_from_comm_status(ucs_status_ptr_t status,
+                                            size_t expected_receive,
+                                            pending_msg):
+    """
+    Same as `create_future_from_comm_status()` but returns None, rather
+    than a finished future, when the operation completed immediately
+    """
+    if UCS_PTR_STATUS(status) == UCS_OK:
+        return None
+    if not UCS_PTR_IS_ERR(status):
+        req = <ucp_request*> status
+        if req.finished and (req.received == -1 or
+                             req.received == expected_receive):
+            ucp_request_reset(req)
+            ucp_request_free(req)
+            return None
+    return create_future_from_comm_status(status, expected_receive, pending_msg)
+
+
 cdef void _send_callback(void *request, ucs_status_t status):
     cdef ucp_request *req = <ucp_request*> request
     if req.future == NULL:
@@ -77,15 +96,27 @@ cdef void _send_callback(void *request, ucs_status_t status):
 
 
 def tag_send(ucp_ep, buffer, nbytes, tag, pending_msg=None):
+    data = get_buffer_data(buffer, check_writable=False)
+    return tag_send_data(ucp_ep, data, nbytes, tag, pending_msg)
+
+
+def tag_send_data(ucp_ep, data, nbytes, tag, pending_msg=None,
+                  none_if_done=False):
+    """
+    Same as `tag_send()` but sends from the data pointer `data`
+    given as a Python integer e.g. returned by `get_buffer_data()`.
+    Set `none_if_done=True` to get None instead of a future when
+    the send completed immediately.
+    """
     cdef ucp_ep_h ep = <ucp_ep_h> PyLong_AsVoidPtr(ucp_ep)
-    cdef void *data = PyLong_AsVoidPtr(get_buffer_data(buffer,
-                                       check_writable=False))
     cdef ucs_status_ptr_t status = ucp_tag_send_nb(ep,
-                                                   data,
+                                                   PyLong_AsVoidPtr(data),
                                                    nbytes,
                                                    ucp_dt_make_contig(1),
                                                    tag,
                                                    _send_callback)
+    if none_if_done:
+        return create_future_or_none_from_comm_status(status, nbytes, pending_msg)
     return create_future_from_comm_status(status, nbytes, pending_msg)
 
 
@@ -121,16 +152,28 @@ cdef void _tag_recv_callback(void *request, ucs_status_t status,
 
 
 def tag_recv(ucp_worker, buffer, nbytes, tag, pending_msg=None):
+    data = get_buffer_data(buffer, check_writable=True)
+    return tag_recv_data(ucp_worker, data, nbytes, tag, pending_msg)
+
+
+def tag_recv_data(ucp_worker, data, nbytes, tag, pending_msg=None,
+                  none_if_done=False):
+    """
+    Same as `tag_recv()` but receives into the data pointer `data`
+    given as a Python integer e.g. returned by `get_buffer_data()`.
+    Set `none_if_done=True` to get None instead of a future when
+    the receive completed immediately.
+    """
     cdef ucp_worker_h worker = <ucp_worker_h> PyLong_AsVoidPtr(ucp_worker)
-    cdef void *data = PyLong_AsVoidPtr(get_buffer_data(buffer,
-                                       check_writable=True))
     cdef ucs_status_ptr_t status = ucp_tag_recv_nb(worker,
-                                                   data,
+                                                   PyLong_AsVoidPtr(data),
                                                    nbytes,
                                                    ucp_dt_make_contig(1),
                                                    tag,
                                                    -1,
                                                    _tag_recv_callback)
+    if none_if_done:
+        return create_future_or_none_from_comm_status(status, nbytes, pending_msg)
     return create_future_from_comm_status(status, nbytes, pending_msg)
 
 
@@ -19,11 +19,7 @@ def _data_from_memoryview(object mview):
     return PyLong_FromVoidPtr(buf.buf)
 
 
-def get_buffer_data(buffer, check_writable=False):
-    """
-    Returns data pointer of the buffer. Raising ValueError if the buffer
-    is read only and check_writable=True is set.
-    """
+cdef _get_buffer_data_and_readonly(buffer):
     iface = None
     if hasattr(buffer, "__cuda_array_interface__"):
         iface = buffer.__cuda_array_interface__
@@ -45,9 +41,24 @@ def get_buffer_data(buffer, check_writable=False):
     if data_ptr == 0:
         raise NotImplementedError("zero-sized buffers isn't supported")
 
+    return data_ptr, data_readonly
+
+
+def get_buffer_data_and_readonly(buffer):
+    """
+    Returns data pointer of the buffer and whether the buffer is read only
+    """
+    return _get_buffer_data_and_readonly(buffer)
+
+
+def get_buffer_data(buffer, check_writable=False):
+    """
+    Returns data pointer of the buffer. Raising ValueError if the buffer
+    is read only and check_writable=True is set.
+    """
+    data_ptr, data_readonly = _get_buffer_data_and_readonly(buffer)
     if check_writable and data_readonly:
         raise ValueError("writing to readonly buffer!")
-
     return data_ptr
 
 
@@ -1,9 +1,13 @@
 # Copyright (c) 2019, NVIDIA CORPORATION. All rights reserved.
 # See file LICENSE for terms.
+# cython: language_level=3
+
+# This module is compiled with Cython (see setup.py) in order to remove the
+# interpreter overhead of the thin wrappers below, which are called on the hot
+# path e.g. `progress()`. Thus, keep it valid Python and avoid constructs that
+# Cython doesn't support.
 
-import gc
 import os
-import weakref
 
 from . import exceptions
 from ._libs import core
@@ -13,12 +17,18 @@ from ._libs import core
 # the instantiation of the application context to the first use of the API.
 _ctx = None
 
+# The version of the underlying UCX installation, see `get_ucx_version()`
+_ucx_version = None
+
 
+# Notice, functions on the hot path such as `progress()` read `_ctx` directly
+# and only fall back to `_get_ctx()` when the context hasn't been created yet.
 def _get_ctx():
     global _ctx
-    if _ctx is None:
-        _ctx = core.ApplicationContext()
-    return _ctx
+    ctx = _ctx
+    if ctx is None:
+        ctx = _ctx = core.ApplicationContext()
+    return ctx
 
 
 # Here comes the public facing API.
@@ -37,10 +47,13 @@ def get_ucx_version():
     tuple
         The version as a tuple e.g. (1, 7, 0)
     """
-    return core.get_ucx_version()
+    global _ucx_version
+    if _ucx_version is None:
+        _ucx_version = core.get_ucx_version()
+    return _ucx_version
 
 
-def init(options={}, env_takes_precedence=False):
+def init(options=None, env_takes_precedence=False):
     """Initiate UCX.
 
     Usually this is done automatically at the first API call
@@ -61,10 +74,10 @@ def init(options={}, env_takes_precedence=False):
             "UCX is already initiated. Call reset() and init() "
             "in order to re-initate UCX with new options."
         )
+    if options is None:
+        options = {}
     if env_takes_precedence:
-        for k in os.environ.keys():
-            if k in options:
-                del options[k]
+        options = {k: v for k, v in options.items() if k not in os.environ}
 
     _ctx = core.ApplicationContext(options)
 
@@ -123,14 +136,95 @@ def progress():
     bool
         Returns True if progress was made
     """
-    return _get_ctx().progress()
+    ctx = _ctx
+    if ctx is None:
+        ctx = _get_ctx()
+    return ctx.progress()
+
+
+def progress_until_idle(max_iters=64):
+    """Progress the communication layer until it is idle
+
+    The looping happens in the compiled core thus this amortizes
+    the cost of calling into the core over many progress iterations.
+    Unlike `progress()`, this stops after `max_iters` iterations thus
+    callers polling the communication layer themselves can bound the time
+    spent progressing. The asyncio event loop keeps using `progress()`,
+    which already loops in the compiled core: the worker must be idle
+    before it can be armed, thus a bounded loop would only make arming
+    fail as busy and progress again.
+
+    Parameters
+    ----------
+    max_iters: int, optional
+        The maximum number of progress iterations
+
+    Returns
+    -------
+    int
+        The number of iterations that progressed communication
+    """
+    ctx = _ctx
+    if ctx is None:
+        ctx = _get_ctx()
+    return ctx.progress_until_idle(max_iters)
+
+
+def try_progress():
+    """Progress the communication layer once
+
+    Unlike `progress()`, this doesn't loop until there is nothing
+    left to progress thus callers can drain the communication layer
+    at their own pace without involving the asyncio event loop.
+
+    Returns
+    -------
+    int
+        The number of communication events progressed, as returned by
+        `ucp_worker_progress()`. Notice, this is not the number of completed
+        sends and receives; an operation might take several events and an
+        event might complete several operations. Zero means that there was
+        nothing to progress.
+    """
+    ctx = _ctx
+    if ctx is None:
+        ctx = _get_ctx()
+    return ctx.try_progress()
 
 
 def get_ucp_worker():
     """Returns the underlying UCP worker handle (ucp_worker_h)
     as a Python integer.
     """
-    return _get_ctx().get_ucp_worker()
+    ctx = _ctx
+    if ctx is None:
+        ctx = _get_ctx()
+    return ctx.get_ucp_worker()
+
+
+def register_memory(buffer):
+    """Register a buffer with UCX
+
+    Registering memory, such as pinning it for RDMA, is costly thus
+    registering a buffer that is transferred repeatedly, e.g. an arena
+    that slices are sent from, pays that cost once. The registration is
+    reused by transports with a registration cache for every transfer
+    within the buffer for as long as the returned handle is open.
+
+    Parameters
+    ----------
+    buffer: exposing the buffer protocol or array/cuda interface
+        The buffer to register
+
+    Returns
+    -------
+    MemoryHandle
+        The handle of the registered buffer. The handle exposes the
+        array/cuda interface of the buffer thus it can be given directly
+        to `Endpoint.send()` and `Endpoint.recv()`. The buffer is
+        unregistered when the handle is closed or deleted.
+    """
+    return _get_ctx().register_memory(buffer)
 
 
 def get_config():
@@ -155,23 +249,23 @@ def get_config():
 def reset():
     """Resets the UCX library by shutting down all of UCX.
 
+    Endpoints, Listeners, and MemoryHandles that are still open are closed.
     The library is initiated at next API call.
     """
     global _ctx
     if _ctx is not None:
         _ctx.unbind_epoll_fd_to_event_loop()
-        weakref_ctx = weakref.ref(_ctx)
+        finalizer = _ctx._finalizer
+        live = _ctx._live
         _ctx = None
-        gc.collect()
-        if weakref_ctx() is not None:
-            msg = (
-                "Trying to reset UCX but not all Endpoints and/or Listeners "
-                "are closed(). The following objects are still referencing "
-                "ApplicationContext: "
+        for o in list(live):
+            if not o.closed():
+                o.close()
+        if finalizer.alive:
+            raise exceptions.UCXError(
+                "Trying to reset UCX but ApplicationContext is still referenced "
+                "after closing all of its Endpoints, Listeners, and MemoryHandles"
             )
-            for o in gc.get_referrers(weakref_ctx()):
-                msg += "\n  %s" % o
-            raise exceptions.UCXError(msg)
 
 
 class Listener:
@@ -181,6 +275,8 @@ class Listener:
     Please use `create_listener()` to create an Listener.
     """
 
+    __slots__ = ("_b", "_closed", "__weakref__")
+
     def __init__(self, backend):
         self._b = backend
         self._closed = False
@@ -211,13 +307,30 @@ class Endpoint:
 
     Please use `create_listener()` and `create_endpoint()`
     to create an Endpoint.
+
+    An Endpoint is also an asynchronous context manager that closes
+    the Endpoint on exit e.g. `async with await create_endpoint(...) as ep:`
     """
 
+    __slots__ = ("_ep", "_closed", "_close_on_del", "_cuda_support", "__weakref__")
+
     def __init__(self, ep):
         self._ep = ep
+        self._closed = False
+        self._cuda_support = ep._cuda_support
+        self._close_on_del = True
 
     def __del__(self):
-        if not self.closed():
+        if self._close_on_del and not self._closed:
+            self.close()
+
+    async def __aenter__(self):
+        # The endpoint is closed explicitly by `__aexit__()`
+        self._close_on_del = False
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if not self._closed:
             self.close()
 
     @property
@@ -235,7 +348,7 @@ class Endpoint:
 
     def closed(self):
         """Is this endpoint closed?"""
-        return self._ep._closed
+        return self._closed
 
     def close(self):
         """Close this endpoint.
@@ -243,6 +356,9 @@ class Endpoint:
         Notice, this functions doesn't signal the connected peer to shutdown
         To do that, use `Endpoint.signal_shutdown()`
         """
+        # Notice, all closing of the underlying endpoint goes through here
+        # thus `_closed` is always in sync with `self._ep._closed`
+        self._closed = True
         return self._ep.close()
 
     async def send(self, buffer, nbytes=None):
@@ -256,7 +372,10 @@ class Endpoint:
         nbytes: int, optional
             Number of bytes to send. Default is the whole buffer.
         """
-        await self._ep.send(buffer, nbytes=nbytes)
+        if nbytes is None:
+            await self._ep.send_full(buffer)
+        else:
+            await self._ep.send_n(buffer, nbytes)
 
     async def recv(self, buffer, nbytes=None):
         """Receive from connected peer into `buffer`.
@@ -269,7 +388,181 @@ class Endpoint:
         nbytes: int, optional
             Number of bytes to receive. Default is the whole buffer.
         """
-        await self._ep.recv(buffer, nbytes=nbytes)
+        if nbytes is None:
+            await self._ep.recv_full(buffer)
+        else:
+            await self._ep.recv_n(buffer, nbytes)
+
+    async def send_full(self, buffer):
+        """Send the whole `buffer` to connected peer.
+
+        Same as `send(buffer)` but without handling the optional
+        arguments, which makes it the fastest way to send a buffer.
+
+        Parameters
+        ----------
+        buffer: exposing the buffer protocol or array/cuda interface
+            The buffer to send.
+        """
+        await self._ep.send_full(buffer)
+
+    async def send_n(self, buffer, nbytes):
+        """Send `buffer` to connected peer.
+
+        Same as `send(buffer, nbytes)` but without handling the optional
+        arguments.
+
+        Parameters
+        ----------
+        buffer: exposing the buffer protocol or array/cuda interface
+            The buffer to send. Raise ValueError if buffer is smaller
+            than nbytes.
+        nbytes: int
+            Number of bytes to send.
+        """
+        await self._ep.send_n(buffer, nbytes)
+
+    async def recv_full(self, buffer):
+        """Receive from connected peer into the whole `buffer`.
+
+        Same as `recv(buffer)` but without handling the optional
+        arguments, which makes it the fastest way to receive a buffer.
+
+        Parameters
+        ----------
+        buffer: exposing the buffer protocol or array/cuda interface
+            The buffer to receive into. Raise ValueError if buffer
+            is read-only.
+        """
+        await self._ep.recv_full(buffer)
+
+    async def recv_n(self, buffer, nbytes):
+        """Receive from connected peer into `buffer`.
+
+        Same as `recv(buffer, nbytes)` but without handling the optional
+        arguments.
+
+        Parameters
+        ----------
+        buffer: exposing the buffer protocol or array/cuda interface
+            The buffer to receive into. Raise ValueError if buffer
+            is smaller than nbytes or read-only.
+        nbytes: int
+            Number of bytes to receive.
+        """
+        await self._ep.recv_n(buffer, nbytes)
+
+    def send_sync(self, buffer, nbytes=None):
+        """Send `buffer` to connected peer, awaiting only if needed.
+
+        UCX often completes small sends immediately, in which case
+        this returns None without involving the asyncio event loop.
+        Otherwise, the returned awaitable must be awaited and `buffer`
+        must be kept alive until then.
+
+        Parameters
+        ----------
+        buffer: exposing the buffer protocol or array/cuda interface
+            The buffer to send. Raise ValueError if buffer is smaller
+            than nbytes.
+        nbytes: int, optional
+            Number of bytes to send. Default is the whole buffer.
+
+        Returns
+        -------
+        None or awaitable
+            None if the send completed immediately
+        """
+        return self._ep.send_sync(buffer, nbytes=nbytes)
+
+    def recv_sync(self, buffer, nbytes=None):
+        """Receive from connected peer into `buffer`, awaiting only if needed.
+
+        UCX completes receives immediately when the message has already
+        arrived, in which case this returns None without involving the
+        asyncio event loop. Otherwise, the returned awaitable must be
+        awaited and `buffer` must be kept alive until then.
+
+        Parameters
+        ----------
+        buffer: exposing the buffer protocol or array/cuda interface
+            The buffer to receive into. Raise ValueError if buffer
+            is smaller than nbytes or read-only.
+        nbytes: int, optional
+            Number of bytes to receive. Default is the whole buffer.
+
+        Returns
+        -------
+        None or awaitable
+            None if the receive completed immediately
+        """
+        return self._ep.recv_sync(buffer, nbytes=nbytes)
+
+    async def send_multi(self, buffers, nbytes=None):
+        """Send a list of buffers to connected peer.
+
+        This is equivalent to calling `send()` on each buffer in order
+        but all the sends are issued at once and awaited together.
+
+        Parameters
+        ----------
+        buffers: list of objects exposing the buffer protocol or array/cuda interface
+            The buffers to send. Raise ValueError if a buffer is smaller
+            than its nbytes.
+        nbytes: list of int, optional
+            Number of bytes to send of each buffer. Default is the whole buffers.
+        """
+        await self._ep.send_multi(buffers, nbytes=nbytes)
+
+    async def recv_multi(self, buffers, nbytes=None):
+        """Receive from connected peer into a list of buffers.
+
+        This is equivalent to calling `recv()` on each buffer in order
+        but all the receives are issued at once and awaited together.
+
+        Parameters
+        ----------
+        buffers: list of objects exposing the buffer protocol or array/cuda interface
+            The buffers to receive into. Raise ValueError if a buffer
+            is smaller than its nbytes or read-only.
+        nbytes: list of int, optional
+            Number of bytes to receive into each buffer. Default is the
+            whole buffers.
+        """
+        await self._ep.recv_multi(buffers, nbytes=nbytes)
+
+    def get_recv_buffer(self, sizehint):
+        """Return the buffer that `recv_buffered()` receives into.
+
+        Like `asyncio.BufferedProtocol.get_buffer()`, the buffer is
+        allocated and registered with UCX once and then reused by every
+        `recv_buffered()` thus avoiding per message buffer handling.
+        A new buffer is only allocated when `sizehint` is greater than
+        the size of the current buffer, which raises UCXError while a
+        `recv_buffered()` is pending.
+
+        Parameters
+        ----------
+        sizehint: int
+            The minimum size of the buffer in bytes
+
+        Returns
+        -------
+        memoryview
+            The receive buffer, which is overwritten by `recv_buffered()`
+        """
+        return self._ep.get_recv_buffer(sizehint)
+
+    async def recv_buffered(self, nbytes):
+        """Receive from connected peer into the buffer of `get_recv_buffer()`.
+
+        Parameters
+        ----------
+        nbytes: int
+            Number of bytes to receive. Raise ValueError if the buffer
+            returned by `get_recv_buffer()` is smaller than nbytes.
+        """
+        await self._ep.recv_buffered(nbytes)
 
     def ucx_info(self):
         """Return low-level UCX info about this endpoint as a string"""
@@ -277,7 +570,7 @@ class Endpoint:
 
     def cuda_support(self):
         """Return whether UCX is configured with CUDA support or not"""
-        return self._ep._cuda_support
+        return self._cuda_support
 
     def get_ucp_worker(self):
         """Returns the underlying UCP worker handle (ucp_worker_h)